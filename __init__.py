@@ -47,6 +47,14 @@ remove_old_actions()
 
 # Register hook for audio playback
 gui_hooks.av_player_did_begin_playing.append(hook.did_begin_playing)
+gui_hooks.av_player_did_end_playing.append(hook.did_end_playing)
+
+# Reload the cached configuration after edits made through Anki's config editor
+def on_config_updated(new_config: dict) -> None:
+    config.invalidate_config()
+    hook.forget_applied_properties()
+
+mw.addonManager.setConfigUpdatedAction(__name__, on_config_updated)
 
 # Create submenu
 sound_menu = QMenu('Adjust Sound Volume', mw)
@@ -55,7 +63,7 @@ mw.form.menuTools.addMenu(sound_menu)
 # Add volume settings action (at the top)
 volume_action = QAction('Settings...', mw)
 volume_action.triggered.connect(lambda: ui.VolumeDialog(mw).show())
-volume_action.setShortcut(QKeySequence(config.load_config().settings_shortcut))
+volume_action.setShortcut(QKeySequence(config.get_config().settings_shortcut))
 sound_menu.addAction(volume_action)
 
 # Add separator
@@ -64,17 +72,17 @@ sound_menu.addSeparator()
 # Add volume controls
 volume_up_action = QAction('Volume Up', mw)
 volume_up_action.triggered.connect(lambda: ui.adjust_volume(10))
-volume_up_action.setShortcut(QKeySequence(config.load_config().volume_up_shortcut))
+volume_up_action.setShortcut(QKeySequence(config.get_config().volume_up_shortcut))
 sound_menu.addAction(volume_up_action)
 
 volume_down_action = QAction('Volume Down', mw)
 volume_down_action.triggered.connect(lambda: ui.adjust_volume(-10))
-volume_down_action.setShortcut(QKeySequence(config.load_config().volume_down_shortcut))
+volume_down_action.setShortcut(QKeySequence(config.get_config().volume_down_shortcut))
 sound_menu.addAction(volume_down_action)
 
 mute_action = QAction('Toggle Mute', mw)
 mute_action.triggered.connect(ui.toggle_mute)
-mute_action.setShortcut(QKeySequence(config.load_config().mute_shortcut))
+mute_action.setShortcut(QKeySequence(config.get_config().mute_shortcut))
 sound_menu.addAction(mute_action)
 
 # Add separator before speed controls
@@ -83,12 +91,12 @@ sound_menu.addSeparator()
 # Add speed controls
 speed_up_action = QAction('Speed Up', mw)
 speed_up_action.triggered.connect(lambda: ui.adjust_speed(0.1))
-speed_up_action.setShortcut(QKeySequence(config.load_config().speed_up_shortcut))
+speed_up_action.setShortcut(QKeySequence(config.get_config().speed_up_shortcut))
 sound_menu.addAction(speed_up_action)
 
 speed_down_action = QAction('Speed Down', mw)
 speed_down_action.triggered.connect(lambda: ui.adjust_speed(-0.1))
-speed_down_action.setShortcut(QKeySequence(config.load_config().speed_down_shortcut))
+speed_down_action.setShortcut(QKeySequence(config.get_config().speed_down_shortcut))
 sound_menu.addAction(speed_down_action)
 
 # Set shortcuts
@@ -1,8 +1,10 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Any, Optional, Tuple
+
 from aqt import mw
-from aqt.utils import showWarning
 
-@dataclass
+@dataclass(frozen=True)
 class LoudnormConfig:
     """Configuration for the loudnorm filter"""
     enabled: bool = False
@@ -10,7 +12,7 @@ class LoudnormConfig:
     dual_mono: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class VolumeConfig:
     """Main volume configuration"""
     volume: int = 100
@@ -25,50 +27,111 @@ class VolumeConfig:
     speed_up_shortcut: str = ""
     speed_down_shortcut: str = ""
 
+    @cached_property
+    def actual_volume(self) -> int:
+        """The volume passed to mpv, taking the mute state into account"""
+        return 0 if self.is_muted else self.volume
+
+    @cached_property
+    def af_string(self) -> str:
+        """The audio filter passed to mpv"""
+        if not self.loudnorm.enabled:
+            return ''
+        dual_mono = 'true' if self.loudnorm.dual_mono else 'false'
+        return f'loudnorm=I={self.loudnorm.i}:dual_mono={dual_mono}'
+
+    @cached_property
+    def mpv_properties(self) -> Tuple[Tuple[str, Any], ...]:
+        """The (name, value) pairs set on mpv when a sound starts playing"""
+        if self.actual_volume == 0:
+            return (('volume', 0), ('af', ''))
+        return (('volume', self.actual_volume),
+                ('af', self.af_string),
+                ('speed', self.playback_speed))
+
+
+def speed_to_percent(speed: float) -> int:
+    """Convert a playback speed to the whole percentage shown on the speed slider"""
+    # round() rather than int(): 1.15 * 100 is 114.99999999999999
+    return round(speed * 100)
+
+
+def _coercion_schema(cls) -> tuple:
+    """Build (name, type, default) entries for the int/bool/float fields of a dataclass"""
+    return tuple((f.name, f.type, f.default) for f in fields(cls)
+                 if f.type in (int, bool, float))
+
+
+# Coercion schemas, built once from the dataclass definitions
+_VOLUME_SCHEMA = _coercion_schema(VolumeConfig)
+_LOUDNORM_SCHEMA = _coercion_schema(LoudnormConfig)
+
+SHORTCUT_FIELDS = ('mute_shortcut', 'settings_shortcut',
+                   'volume_up_shortcut', 'volume_down_shortcut',
+                   'speed_up_shortcut', 'speed_down_shortcut')
+
+# Parsed configuration shared by the playback hook and the UI
+_cached_config: Optional[VolumeConfig] = None
+
 
 def load_config() -> VolumeConfig:
     """Load the sound volume configuration from Anki's configuration system"""
-    volume_config = VolumeConfig()
-    
+    # Get addon config from Anki
+    addon_config = mw.addonManager.getConfig(__name__)
+
+    if not isinstance(addon_config, dict):
+        from aqt.utils import showWarning
+        showWarning("Invalid configuration format. Resetting to defaults.")
+        return VolumeConfig()
+
+    # Nothing to load from an empty config
+    if not addon_config:
+        return VolumeConfig()
+
+    get = addon_config.get
     try:
-        # Get addon config from Anki
-        addon_config = mw.addonManager.getConfig(__name__)
-        
-        if not isinstance(addon_config, dict):
-            showWarning("Invalid configuration format. Resetting to defaults.")
-            return volume_config
-        
-        # If config exists, load it
-        if addon_config:
-            # Load configuration with type checking
-            volume_config.volume = int(addon_config.get('volume', 100))
-            volume_config.is_muted = bool(addon_config.get('is_muted', False))
-            volume_config.allow_volume_boost = bool(addon_config.get('allow_volume_boost', False))
-            volume_config.playback_speed = float(addon_config.get('playback_speed', 1.0))
-            
-            # Load shortcuts
-            for shortcut_name in ['mute_shortcut', 'settings_shortcut', 
-                                'volume_up_shortcut', 'volume_down_shortcut',
-                                'speed_up_shortcut', 'speed_down_shortcut']:
-                value = addon_config.get(shortcut_name, "")
-                setattr(volume_config, shortcut_name, str(value) if value else "")
-
-            # Load loudnorm settings
-            loudnorm = addon_config.get('loudnorm', {})
-            if isinstance(loudnorm, dict):
-                volume_config.loudnorm.enabled = bool(loudnorm.get('enabled', False))
-                volume_config.loudnorm.i = int(loudnorm.get('i', -24))
-                volume_config.loudnorm.dual_mono = bool(loudnorm.get('dual_mono', False))
-                
-    except Exception as e:
+        # Load configuration with type checking
+        kwargs = {name: coerce(get(name, default))
+                  for name, coerce, default in _VOLUME_SCHEMA}
+
+        # Load shortcuts
+        for shortcut_name in SHORTCUT_FIELDS:
+            value = get(shortcut_name)
+            kwargs[shortcut_name] = str(value) if value else ""
+
+        # Load loudnorm settings
+        loudnorm = get('loudnorm', {})
+        if isinstance(loudnorm, dict):
+            loudnorm_get = loudnorm.get
+            kwargs['loudnorm'] = LoudnormConfig(**{
+                name: coerce(loudnorm_get(name, default))
+                for name, coerce, default in _LOUDNORM_SCHEMA})
+    except (ValueError, TypeError, OverflowError) as e:
+        from aqt.utils import showWarning
         showWarning(f"Error loading configuration: {str(e)}\nResetting to defaults.")
-        
-    return volume_config
+        return VolumeConfig()
+
+    return VolumeConfig(**kwargs)
+
+
+def get_config() -> VolumeConfig:
+    """Return the cached configuration, loading it on first use"""
+    global _cached_config
+    if _cached_config is None:
+        _cached_config = load_config()
+    return _cached_config
+
+
+def invalidate_config() -> None:
+    """Drop the cached configuration so the next access reloads it"""
+    global _cached_config
+    _cached_config = None
 
 
 def save_config(volume_config: VolumeConfig) -> None:
     """Save configuration using Anki's configuration system"""
     if not isinstance(volume_config, VolumeConfig):
+        from aqt.utils import showWarning
         showWarning("Invalid configuration object")
         return
 
@@ -90,7 +153,14 @@ def save_config(volume_config: VolumeConfig) -> None:
         }
     }
     
+    global _cached_config
     try:
         mw.addonManager.writeConfig(__name__, config)
     except Exception as e:
-        showWarning(f"Failed to save volume settings: {str(e)}")
\ No newline at end of file
+        from aqt.utils import showWarning
+        showWarning(f"Failed to save volume settings: {str(e)}")
+        return
+
+    # The object was built by our own code and is already typed, so cache it
+    # as-is instead of reading it back through load_config
+    _cached_config = volume_config
@@ -19,39 +19,64 @@ Original by Muneyuki Noguchi
 Modified by egg rolls
 """
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from aqt.sound import MpvManager
 from anki.sound import AVTag
 
 from . import config
 
+# Properties last set on the mpv player, used to skip redundant IPC calls
+_last_player: Optional[MpvManager] = None
+_last_applied: Dict[str, Any] = {}
+
+# mpv players that are currently playing a sound
+_active_players: List[MpvManager] = []
+
+
+def forget_applied_properties() -> None:
+    """Make the next playback set every property on mpv again."""
+    _last_applied.clear()
+
+
 def did_begin_playing(player: MpvManager, tag: Optional[AVTag] = None) -> None:
     """Set the sound volume for mpv player."""
+    global _last_player
     try:
         if player is None or not isinstance(player, MpvManager):
             return
 
-        volume_config = config.load_config()
-        actual_volume = 0 if volume_config.is_muted else volume_config.volume
-        
-        # Set volume
-        player.set_property('volume', actual_volume)
-        
-        if volume_config.is_muted or actual_volume == 0:
-            player.set_property('af', '')
-            return
+        if player not in _active_players:
+            _active_players.append(player)
+
+        if player is not _last_player:
+            _last_applied.clear()
+            _last_player = player
+
+        # Set volume, loudnorm filter and playback speed if they changed
+        for name, value in config.get_config().mpv_properties:
+            if name in _last_applied and _last_applied[name] == value:
+                continue
+            player.set_property(name, value)
+            _last_applied[name] = value
 
-        # Configure audio filter for loudnorm
-        if volume_config.loudnorm.enabled:
-            i = volume_config.loudnorm.i
-            dual_mono = str(volume_config.loudnorm.dual_mono).lower()
-            player.set_property('af', f'loudnorm=I={i}:dual_mono={dual_mono}')
-        else:
-            player.set_property('af', '')
-        
-        # Set playback speed
-        player.set_property('speed', volume_config.playback_speed)
-                
     except Exception as e:
-        print(f"Sound volume control error: {str(e)}")
\ No newline at end of file
+        print(f"Sound volume control error: {str(e)}")
+
+
+def did_end_playing(player: Any) -> None:
+    """Forget the player once its sound finished playing."""
+    if player in _active_players:
+        _active_players.remove(player)
+
+
+def apply_speed(speed: float) -> None:
+    """Change the playback speed of the sounds currently playing."""
+    for player in _active_players:
+        try:
+            player.set_property('speed', speed)
+        except Exception as e:
+            print(f"Sound volume control error: {str(e)}")
+            continue
+        if player is _last_player:
+            _last_applied['speed'] = speed
@@ -18,6 +18,7 @@ Test the behavior in loading configurations
 """
 import sys
 import unittest
+from dataclasses import FrozenInstanceError
 from typing import Dict, Union, Any
 from unittest.mock import MagicMock, patch
 
@@ -35,6 +36,7 @@ sys.modules['aqt'] = mock_aqt
 sys.modules['aqt.utils'] = mock_aqt.utils
 
 # Now we can safely import config
+import config
 from config import load_config, VolumeConfig, LoudnormConfig
 
 
@@ -119,6 +121,17 @@ class TestConfig(unittest.TestCase):
         })
         self.assertEqual(actual.volume, 70)
 
+    def test_numeric_strings(self) -> None:
+        """Test that numeric strings are coerced."""
+        actual = self._get_config({
+            'volume': '70',
+            'playback_speed': '1.5',
+            'loudnorm': {'i': '-30'}
+        })
+        self.assertEqual(actual.volume, 70)
+        self.assertEqual(actual.playback_speed, 1.5)
+        self.assertEqual(actual.loudnorm.i, -30)
+
     def test_invalid_volume(self) -> None:
         """Test with an invalid volume value."""
         actual = self._get_config({
@@ -128,6 +141,14 @@ class TestConfig(unittest.TestCase):
         expected = VolumeConfig()
         self.assertEqual(actual, expected)
 
+    def test_infinite_volume(self) -> None:
+        """Test with a volume too large to convert to an integer."""
+        actual = self._get_config({
+            'volume': float('inf')
+        })
+        expected = VolumeConfig()
+        self.assertEqual(actual, expected)
+
     def test_playback_speed(self) -> None:
         """Test valid playback speed."""
         actual = self._get_config({
@@ -144,6 +165,15 @@ class TestConfig(unittest.TestCase):
         expected = VolumeConfig()
         self.assertEqual(actual, expected)
 
+    def test_invalid_value_discards_valid_ones(self) -> None:
+        """Test that a partially loaded config is not returned."""
+        actual = self._get_config({
+            'volume': 50,
+            'playback_speed': 'fast'
+        })
+        expected = VolumeConfig()
+        self.assertEqual(actual, expected)
+
     def test_shortcuts(self) -> None:
         """Test shortcut configurations."""
         actual = self._get_config({
@@ -174,6 +204,40 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(actual.loudnorm.i, -24)
         self.assertFalse(actual.loudnorm.dual_mono)
 
+    def test_playback_properties(self) -> None:
+        """Test the values derived for mpv."""
+        actual = self._get_config({
+            'volume': 80,
+            'loudnorm': {
+                'enabled': True,
+                'i': -30,
+                'dual_mono': True
+            }
+        })
+        self.assertEqual(actual.actual_volume, 80)
+        self.assertEqual(actual.af_string, 'loudnorm=I=-30:dual_mono=true')
+        self.assertEqual(actual.mpv_properties, (
+            ('volume', 80),
+            ('af', 'loudnorm=I=-30:dual_mono=true'),
+            ('speed', 1.0)
+        ))
+
+    def test_playback_properties_muted(self) -> None:
+        """Test the values derived for mpv when muted."""
+        actual = self._get_config({
+            'volume': 80,
+            'is_muted': True
+        })
+        self.assertEqual(actual.actual_volume, 0)
+        self.assertEqual(actual.mpv_properties, (('volume', 0), ('af', '')))
+
+    def test_config_is_immutable(self) -> None:
+        """Test that a loaded config cannot be modified in place."""
+        actual = self._get_config({'volume': 80})
+        with self.assertRaises(FrozenInstanceError):
+            actual.volume = 50
+        self.assertEqual(hash(actual), hash(VolumeConfig(volume=80)))
+
     def test_loudnorm_invalid_type(self) -> None:
         """Test loudnorm with invalid type."""
         actual = self._get_config({
@@ -185,9 +249,68 @@ class TestConfig(unittest.TestCase):
 
     def test_invalid_config_format(self) -> None:
         """Test with non-dict config."""
+        mock_aqt.utils.showWarning.reset_mock()
         actual = self._get_config("not a dict")
         expected = VolumeConfig()
         self.assertEqual(actual, expected)
+        mock_aqt.utils.showWarning.assert_called_once()
+
+
+class TestSpeedToPercent(unittest.TestCase):
+    """A class to test the conversion of speeds to slider positions"""
+
+    def test_round_trip(self) -> None:
+        """Every 0.05 step survives the slider round trip."""
+        for percent in range(25, 201, 5):
+            speed = percent / 100
+            self.assertEqual(config.speed_to_percent(speed), percent)
+            self.assertEqual(config.speed_to_percent(speed) / 100.0, speed)
+
+    def test_float_error(self) -> None:
+        """1.15 is not truncated to 114."""
+        self.assertEqual(config.speed_to_percent(1.15), 115)
+
+
+class TestConfigCache(unittest.TestCase):
+    """A class to test the caching of configurations"""
+
+    def setUp(self) -> None:
+        mock_aqt.mw.reset_mock()
+        mock_aqt.mw.addonManager.writeConfig.side_effect = None
+        self.mock_mw = mock_aqt.mw
+        self.mock_mw.addonManager.getConfig.return_value = {'volume': 70}
+        config.invalidate_config()
+
+    def test_get_config_is_cached(self) -> None:
+        """The configuration is read only once."""
+        first = config.get_config()
+        second = config.get_config()
+        self.assertIs(first, second)
+        self.assertEqual(first.volume, 70)
+        self.mock_mw.addonManager.getConfig.assert_called_once()
+
+    def test_invalidate_config(self) -> None:
+        """Invalidating the cache reloads the configuration."""
+        config.get_config()
+        self.mock_mw.addonManager.getConfig.return_value = {'volume': 30}
+        config.invalidate_config()
+        self.assertEqual(config.get_config().volume, 30)
+
+    def test_save_config_updates_cache(self) -> None:
+        """Saving replaces the cached configuration."""
+        volume_config = VolumeConfig(volume=40)
+        config.save_config(volume_config)
+        with patch.object(config, 'load_config') as mock_load:
+            self.assertIs(config.get_config(), volume_config)
+            mock_load.assert_not_called()
+        self.mock_mw.addonManager.getConfig.assert_not_called()
+
+    def test_failed_save_keeps_cache(self) -> None:
+        """A failed write leaves the cached configuration untouched."""
+        cached = config.get_config()
+        self.mock_mw.addonManager.writeConfig.side_effect = OSError('disk full')
+        config.save_config(VolumeConfig(volume=40))
+        self.assertIs(config.get_config(), cached)
 
 
 if __name__ == '__main__':
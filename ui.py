@@ -19,17 +19,26 @@ Original by Muneyuki Noguchi
 Modified by egg rolls
 """
 
-from typing import Tuple
+# Performance note: do not compile this module with Cython or similar tools.
+# Its code runs once per dialog open or shortcut press and is bound by Qt
+# signal traffic and config I/O, which the config cache in config.py and the
+# signal blocking in VolumeDialog address instead.
+
+from dataclasses import replace
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import bisect
+import functools
 import os
 import json
 
-from aqt import gui_hooks
 from aqt import mw
 from aqt.qt import (
     QCheckBox, QDialog, QDialogButtonBox, QGridLayout, QGroupBox,
     QHBoxLayout, QLabel, QMessageBox, QSizePolicy, QSlider,
     QSpinBox, QVBoxLayout, QWidget, Qt, QShortcut, QKeySequence,
-    QKeySequenceEdit, QAction, QPushButton, QMainWindow, QDoubleSpinBox
+    QKeySequenceEdit, QPushButton, QMainWindow, QDoubleSpinBox,
+    QSignalBlocker, QApplication
 )
 from aqt.sound import MpvManager
 from aqt.sound import av_player
@@ -38,22 +47,61 @@ from aqt.utils import tooltip
 from . import config
 from . import hook
 
+_ADDON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _load_defaults() -> MappingProxyType:
+    """Read the default settings shipped with the add-on"""
+    with open(os.path.join(_ADDON_DIR, "config.json"), 'r') as f:
+        return MappingProxyType(json.load(f))
+
+
+# Default settings, read once for the reset buttons
+_DEFAULT_CONFIG = _load_defaults()
+
+# Parsed key sequences of the default shortcuts
+_DEFAULT_KEYSEQ = {name: QKeySequence(_DEFAULT_CONFIG[name])
+                   for name in config.SHORTCUT_FIELDS}
+
+
+@functools.lru_cache(maxsize=32)
+def _kseq(key: str) -> QKeySequence:
+    """Parse a shortcut string, reusing earlier results"""
+    return QKeySequence(key)
+
+# At least one of these modifiers is required in every shortcut
+_MODIFIER_MASK = (
+    Qt.KeyboardModifier.ControlModifier |
+    Qt.KeyboardModifier.AltModifier |
+    Qt.KeyboardModifier.ShiftModifier |
+    Qt.KeyboardModifier.MetaModifier
+)
+
+# Playback speeds the speed up/down shortcuts step through
+_SPEED_STEPS = (0.25, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.75, 2.0)
+
+
+# Shortcut strings the global shortcuts were last registered with
+_last_shortcut_sig: Tuple[str, ...] = ()
+
+
+def _shortcut_sig(volume_config: config.VolumeConfig) -> Tuple[str, ...]:
+    return tuple(getattr(volume_config, name) for name in config.SHORTCUT_FIELDS)
+
+
 def save_config(volume_config: config.VolumeConfig) -> None:
     """Save the sound volume configuration."""
     # Save to config.json
     config.save_config(volume_config)
 
-    gui_hooks.av_player_did_begin_playing.remove(hook.did_begin_playing)
-    gui_hooks.av_player_did_begin_playing.append(hook.did_begin_playing)
-    
-    # Reset shortcuts
-    setup_shortcuts()
+    # Reset shortcuts, only when they changed
+    if _shortcut_sig(volume_config) != _last_shortcut_sig:
+        setup_shortcuts()
 
 
 def _create_config_widgets(text: str, min_max: Tuple[int, int]) \
         -> Tuple[QLabel, QSlider, QSpinBox]:
-    label = QLabel()
-    label.setText(text)
+    label = QLabel(text)
     label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
 
     slider = QSlider()
@@ -76,14 +124,55 @@ def _create_config_widgets(text: str, min_max: Tuple[int, int]) \
     return label, slider, spin_box
 
 
+def _has_modifier(sequence: QKeySequence) -> bool:
+    """Check whether the first key combination of a sequence has a modifier"""
+    return bool(sequence[0].keyboardModifiers() & _MODIFIER_MASK)
+
+
+def _hint_label(text: str) -> QLabel:
+    label = QLabel(text)
+    label.setStyleSheet("color: gray; font-size: 11px;")
+    return label
+
+
+def _build_group(group: QGroupBox, rows: List[List[QWidget]]) -> QGroupBox:
+    """Lay out rows of widgets in a three-column grid inside the group box.
+
+    A row holding a single widget spans all columns.
+    """
+    layout = QGridLayout()
+    for row, widgets in enumerate(rows):
+        if len(widgets) == 1:
+            layout.addWidget(widgets[0], row, 0, 1, 3)
+            continue
+        for column, widget in enumerate(widgets):
+            layout.addWidget(widget, row, column)
+    group.setLayout(layout)
+    return group
+
+
 def _set_value(value: int, slider: QSlider, spin_box: QSpinBox) -> None:
-    for widget in [slider, spin_box]:
-        widget.setValue(value)
+    slider.setValue(value)
+    # The spin box follows the slider through valueChanged unless its
+    # signals are blocked
+    if spin_box.value() != value:
+        spin_box.setValue(value)
+
+
+def _bulk_set(widgets: Iterable[QWidget], fn: Callable[[], None]) -> None:
+    """Call fn with the signals of the given widgets blocked"""
+    for widget in widgets:
+        widget.blockSignals(True)
+    try:
+        fn()
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
 
 
 def adjust_volume(delta: int):
     """Adjust the volume level"""
-    volume_config = config.load_config()
+    volume_config = config.get_config()
     max_volume = 200 if volume_config.allow_volume_boost else 100
     new_volume = max(0, min(max_volume, volume_config.volume + delta))
     
@@ -91,17 +180,18 @@ def adjust_volume(delta: int):
     if abs(delta) > max_volume:
         delta = max_volume if delta > 0 else -max_volume
     
+    is_muted = volume_config.is_muted
     # Set to mute if volume is 0
     if new_volume == 0:
-        volume_config.is_muted = True
+        is_muted = True
     # Unmute if increasing volume from 0
     elif volume_config.volume == 0 and new_volume > 0:
-        volume_config.is_muted = False
+        is_muted = False
     # Unmute if increasing volume from muted state
-    elif delta > 0 and volume_config.is_muted:
-        volume_config.is_muted = False
+    elif delta > 0 and is_muted:
+        is_muted = False
     
-    volume_config.volume = new_volume
+    volume_config = replace(volume_config, volume=new_volume, is_muted=is_muted)
     save_config(volume_config)
     
     # Show volume status
@@ -111,39 +201,28 @@ def adjust_volume(delta: int):
 
 def _get_nearest_speed(current_speed: float, increase: bool) -> float:
     """Get the nearest valid speed value from the predefined steps"""
-    SPEED_STEPS = [0.25, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.75, 2.0]
-    
     # Find the next or previous valid speed
     if increase:
-        for speed in SPEED_STEPS:
-            if speed > current_speed:
-                return speed
-        return SPEED_STEPS[-1]  # Return max speed if already at max
+        i = bisect.bisect_right(_SPEED_STEPS, current_speed)
+        # Return max speed if already at max
+        return _SPEED_STEPS[i] if i < len(_SPEED_STEPS) else _SPEED_STEPS[-1]
     else:
-        for speed in reversed(SPEED_STEPS):
-            if speed < current_speed:
-                return speed
-        return SPEED_STEPS[0]  # Return min speed if already at min
+        i = bisect.bisect_left(_SPEED_STEPS, current_speed)
+        # Return min speed if already at min
+        return _SPEED_STEPS[i - 1] if i > 0 else _SPEED_STEPS[0]
 
 def adjust_speed(delta: float):
     """Adjust the playback speed using predefined steps"""
-    volume_config = config.load_config()
+    volume_config = config.get_config()
     
     # Get next speed based on direction
     new_speed = _get_nearest_speed(volume_config.playback_speed, delta > 0)
     
     # Save and apply the new speed
-    volume_config.playback_speed = new_speed
-    save_config(volume_config)
+    save_config(replace(volume_config, playback_speed=new_speed))
     
     # Apply speed change to current player if any
-    from aqt.sound import av_player
-    for player in getattr(av_player, 'players', []):
-        try:
-            if isinstance(player, MpvManager):
-                player.set_property('speed', new_speed)
-        except:
-            pass
+    hook.apply_speed(new_speed)
     
     tooltip(f"Speed: {new_speed:.2f}x")
 
@@ -165,13 +244,26 @@ def _create_speed_widgets() -> Tuple[QLabel, QSlider, QDoubleSpinBox]:
     
     return label, slider, spin_box
 
-def _round_to_nearest_step(value: float, step: float = 0.05) -> float:
-    """Round a value to the nearest step"""
-    return round(value / step) * step
+def _round_to_nearest_step(value: float) -> float:
+    """Round a value to the nearest 0.05 step"""
+    return round(value * 20) / 20
 
 class VolumeDialog(QDialog):
     """A dialog window to set the sound volume"""
 
+    # Shortcut editor names, their labels and the config fields they edit
+    _EDITOR_FIELDS = {
+        "volume_up_shortcut_edit": ("Volume Up:", "volume_up_shortcut"),
+        "volume_down_shortcut_edit": ("Volume Down:", "volume_down_shortcut"),
+        "mute_shortcut_edit": ("Toggle Mute:", "mute_shortcut"),
+        "settings_shortcut_edit": ("Settings:", "settings_shortcut"),
+        "speed_up_shortcut_edit": ("Speed Up:", "speed_up_shortcut"),
+        "speed_down_shortcut_edit": ("Speed Down:", "speed_down_shortcut")
+    }
+    # Default key sequence of each shortcut editor
+    _DEFAULT_KSEQ_BY_ATTR = {attr: _DEFAULT_KEYSEQ[field]
+                             for attr, (_label, field) in _EDITOR_FIELDS.items()}
+
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent)
         self.setWindowTitle("Adjust Sound Volume Settings")
@@ -179,51 +271,28 @@ class VolumeDialog(QDialog):
         self._current_session_boost_enabled = False
         
         # Volume section
-        volume_group = QGroupBox("Volume")
-        volume_layout = QGridLayout()
-        
-        # Volume slider and spinbox
         volume_label, self.volume_slider, self.volume_spin_box = _create_config_widgets(
             'Volume', (0, 200))
-        volume_layout.addWidget(volume_label, 0, 0)
-        volume_layout.addWidget(self.volume_slider, 0, 1)
-        volume_layout.addWidget(self.volume_spin_box, 0, 2)
-        
+
         # Volume boost checkbox
         self.volume_boost_check_box = QCheckBox('Allow volume boost above 100%')
         self.volume_boost_check_box.stateChanged.connect(self.on_volume_boost_changed)
-        volume_layout.addWidget(self.volume_boost_check_box, 1, 0, 1, 3)
-        
+
         # Mute checkbox
         self.mute_check_box = QCheckBox("Mute")
-        volume_layout.addWidget(self.mute_check_box, 2, 0, 1, 3)
-        
         self.mute_check_box.stateChanged.connect(self.on_mute_changed_silent)
         self.mute_check_box.stateChanged.connect(self.update_volume_controls)
-        
-        volume_group.setLayout(volume_layout)
+
+        volume_group = _build_group(QGroupBox("Volume"), [
+            [volume_label, self.volume_slider, self.volume_spin_box],
+            [self.volume_boost_check_box],
+            [self.mute_check_box],
+        ])
 
         # Loudness normalization settings
-        self.loudnorm_group_box = QGroupBox("Loudness Normalization")
-        self.loudnorm_group_box.setCheckable(True)
-        self.loudnorm_group_box.toggled.connect(self._show_warning_on_non_mpv)
-        
-        # Create loudnorm layout
-        loudnorm_layout = QGridLayout()
-        
-        # I value slider and spinbox
         i_label, self.i_slider, self.i_spin_box = _create_config_widgets(
             'Integrated loudness', (-50, -14))
-        
-        loudnorm_layout.addWidget(i_label, 0, 0)
-        loudnorm_layout.addWidget(self.i_slider, 0, 1)
-        loudnorm_layout.addWidget(self.i_spin_box, 0, 2)
-        
-        # Add info text
-        i_info = QLabel("Safe range: -50 to -20 dB")
-        i_info.setStyleSheet("color: gray; font-size: 11px;")
-        loudnorm_layout.addWidget(i_info, 1, 0, 1, 3)
-        
+
         # Add value change warning
         self._last_value = self.i_spin_box.value()  # Record previous value
         def on_loudness_change(value):
@@ -232,77 +301,56 @@ class VolumeDialog(QDialog):
                     'Setting integrated loudness above -20 dB may cause audio instability.\n'
                     'Recommended range is between -50 and -20 dB.')
             self._last_value = value
-        
+
         self.i_spin_box.valueChanged.connect(on_loudness_change)
-        
+
         # Add dual mono checkbox
         self.dual_mono_check_box = QCheckBox('Treat mono input as dual-mono')
-        loudnorm_layout.addWidget(self.dual_mono_check_box, 2, 0, 1, 3)
-        
-        # Set layout for loudnorm group box
-        self.loudnorm_group_box.setLayout(loudnorm_layout)
-        
+
+        self.loudnorm_group_box = QGroupBox("Loudness Normalization")
+        self.loudnorm_group_box.setCheckable(True)
+        self.loudnorm_group_box.toggled.connect(self._show_warning_on_non_mpv)
+        _build_group(self.loudnorm_group_box, [
+            [i_label, self.i_slider, self.i_spin_box],
+            [_hint_label("Safe range: -50 to -20 dB")],
+            [self.dual_mono_check_box],
+        ])
+
         # Shortcuts section
-        shortcuts_group = QGroupBox("Keyboard Shortcuts")
-        shortcuts_layout = QGridLayout()
-        
-        # Add shortcut instruction label
-        instruction_label = QLabel("Click to record shortcut, press ESC to clear")
-        instruction_label.setStyleSheet("color: gray; font-size: 11px;")
-        shortcuts_layout.addWidget(instruction_label, 0, 0, 1, 3)
-        
-        # Define shortcut items
-        shortcut_items = [
-            ("Volume Up:", "volume_up_shortcut_edit"),
-            ("Volume Down:", "volume_down_shortcut_edit"),
-            ("Toggle Mute:", "mute_shortcut_edit"),
-            ("Settings:", "settings_shortcut_edit"),
-            ("Speed Up:", "speed_up_shortcut_edit"),
-            ("Speed Down:", "speed_down_shortcut_edit")
-        ]
-        
-        # Add shortcut editors
-        row = 1
+        shortcut_rows = [[_hint_label("Click to record shortcut, press ESC to clear")]]
         self.shortcut_editors = {}
-        for label_text, attr_name in shortcut_items:
+        # Current key sequence string of each non-empty shortcut editor
+        self._seq_by_editor: Dict[QKeySequenceEdit, str] = {}
+        # The same mapping reversed, for the duplicate check
+        self._editor_by_seq: Dict[str, QKeySequenceEdit] = {}
+        for attr_name, (label_text, _field) in self._EDITOR_FIELDS.items():
             label = QLabel(label_text)
             label.setMinimumWidth(100)
             editor = QKeySequenceEdit()
-            
+
             # Connect validation and install event filter
             editor.keySequenceChanged.connect(self.validate_shortcut)
             editor.installEventFilter(self)
-            
-            setattr(self, attr_name, editor)
+
             self.shortcut_editors[attr_name] = editor
-            
-            shortcuts_layout.addWidget(label, row, 0)
-            shortcuts_layout.addWidget(editor, row, 1)
-            row += 1
-        
+            shortcut_rows.append([label, editor])
+
         # Reset shortcuts button
         reset_shortcuts_button = QPushButton("Reset Shortcuts to Default")
         reset_shortcuts_button.clicked.connect(self._reset_shortcuts)
-        shortcuts_layout.addWidget(reset_shortcuts_button, len(shortcut_items) + 1, 0, 1, 3)
-        
-        shortcuts_group.setLayout(shortcuts_layout)
-        
+        shortcut_rows.append([reset_shortcuts_button])
+
+        shortcuts_group = _build_group(QGroupBox("Keyboard Shortcuts"), shortcut_rows)
+
         # Speed section
-        speed_group = QGroupBox("Playback Speed")
-        speed_layout = QGridLayout()
-        
-        # Create speed controls
         speed_label, self.speed_slider, self.speed_spin_box = _create_speed_widgets()
-        speed_layout.addWidget(speed_label, 0, 0)
-        speed_layout.addWidget(self.speed_slider, 0, 1)
-        speed_layout.addWidget(self.speed_spin_box, 0, 2)
-        
-        # Connect speed controls
         self.speed_slider.valueChanged.connect(self._on_speed_slider_changed)
         self.speed_spin_box.valueChanged.connect(self._on_speed_spin_changed)
-        
-        speed_group.setLayout(speed_layout)
-        
+
+        speed_group = _build_group(QGroupBox("Playback Speed"), [
+            [speed_label, self.speed_slider, self.speed_spin_box],
+        ])
+
         # Main layout
         layout = QVBoxLayout()
         layout.addWidget(volume_group)
@@ -336,36 +384,26 @@ class VolumeDialog(QDialog):
             "Are you sure you want to reset all settings to default values?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         ) == QMessageBox.StandardButton.Yes:
-            # Load default settings from config.json
-            addon_dir = os.path.dirname(os.path.abspath(__file__))
-            config_path = os.path.join(addon_dir, "config.json")
-            with open(config_path, 'r') as f:
-                default_config = json.load(f)
-            
+            default_config = _DEFAULT_CONFIG
+
             # Update UI elements
-            self.volume_slider.setValue(default_config["volume"])
-            self.volume_spin_box.setValue(default_config["volume"])
+            _set_value(default_config["volume"], self.volume_slider, self.volume_spin_box)
             self.volume_boost_check_box.setChecked(default_config["allow_volume_boost"])
             self.mute_check_box.setChecked(default_config["is_muted"])
             
             # Update speed controls
-            speed_value = int(default_config["playback_speed"] * 100)
+            speed_value = config.speed_to_percent(default_config["playback_speed"])
             self.speed_slider.setValue(speed_value)
             self.speed_spin_box.setValue(default_config["playback_speed"])
             
             # Update loudnorm settings
             self.loudnorm_group_box.setChecked(default_config["loudnorm"]["enabled"])
-            self.i_slider.setValue(default_config["loudnorm"]["i"])
-            self.i_spin_box.setValue(default_config["loudnorm"]["i"])
+            _set_value(default_config["loudnorm"]["i"], self.i_slider, self.i_spin_box)
             self.dual_mono_check_box.setChecked(default_config["loudnorm"]["dual_mono"])
             
             # Update shortcuts
-            self.mute_shortcut_edit.setKeySequence(QKeySequence(default_config["mute_shortcut"]))
-            self.settings_shortcut_edit.setKeySequence(QKeySequence(default_config["settings_shortcut"]))
-            self.volume_up_shortcut_edit.setKeySequence(QKeySequence(default_config["volume_up_shortcut"]))
-            self.volume_down_shortcut_edit.setKeySequence(QKeySequence(default_config["volume_down_shortcut"]))
-            self.speed_up_shortcut_edit.setKeySequence(QKeySequence(default_config["speed_up_shortcut"]))
-            self.speed_down_shortcut_edit.setKeySequence(QKeySequence(default_config["speed_down_shortcut"]))
+            for attr, key_sequence in self._DEFAULT_KSEQ_BY_ATTR.items():
+                self.shortcut_editors[attr].setKeySequence(key_sequence)
             
             tooltip("All settings have been reset to default values")
 
@@ -390,32 +428,45 @@ class VolumeDialog(QDialog):
         ) != QMessageBox.StandardButton.Yes:
             return
             
-        default_shortcuts = {
-            'volume_up': "Ctrl+Alt+Up",
-            'volume_down': "Ctrl+Alt+Down",
-            'mute': "Ctrl+Alt+M",
-            'settings': "Ctrl+Alt+V",
-            'speed_up': "Ctrl+Alt+Right",
-            'speed_down': "Ctrl+Alt+Left"
-        }
-        
-        for name, shortcut in default_shortcuts.items():
-            if hasattr(self, f"{name}_shortcut_edit"):
-                editor = getattr(self, f"{name}_shortcut_edit")
-                editor.setKeySequence(QKeySequence(shortcut))
+        for attr, key_sequence in self._DEFAULT_KSEQ_BY_ATTR.items():
+            self.shortcut_editors[attr].setKeySequence(key_sequence)
         
         tooltip("Shortcuts reset to default values")
 
     def on_mute_changed_silent(self, state):
         """Handle mute state change without showing tooltip"""
-        volume_config = config.load_config()
-        volume_config.is_muted = bool(state)
-        save_config(volume_config)
+        volume_config = config.get_config()
+        save_config(replace(volume_config, is_muted=bool(state)))
     
     def show(self) -> None:
         """Show the dialog window and its widgets."""
-        volume_config = config.load_config()
-        
+        volume_config = config.get_config()
+
+        # Populate the widgets without firing their change handlers
+        widgets = [
+            self.volume_boost_check_box, self.volume_slider, self.volume_spin_box,
+            self.mute_check_box, self.loudnorm_group_box, self.i_slider,
+            self.i_spin_box, self.dual_mono_check_box, self.speed_slider,
+            self.speed_spin_box, *self.shortcut_editors.values()
+        ]
+        _bulk_set(widgets, lambda: self._populate(volume_config))
+
+        # Refresh the state the blocked handlers would have updated
+        self._last_value = volume_config.loudnorm.i
+        self._seq_by_editor = {
+            editor: editor.keySequence().toString()
+            for editor in self.shortcut_editors.values()
+            if not editor.keySequence().isEmpty()
+        }
+        self._editor_by_seq = {
+            key_string: editor for editor, key_string in self._seq_by_editor.items()
+        }
+        self.update_volume_controls(volume_config.is_muted)
+
+        super().show()
+
+    def _populate(self, volume_config: config.VolumeConfig) -> None:
+        """Set the widgets to the values of the configuration"""
         # Update the session state when dialog opens
         self._current_session_boost_enabled = volume_config.allow_volume_boost
         
@@ -431,9 +482,8 @@ class VolumeDialog(QDialog):
         _set_value(volume_config.volume,
                    self.volume_slider, self.volume_spin_box)
 
-        # Set mute state and update control states
+        # Set mute state
         self.mute_check_box.setChecked(volume_config.is_muted)
-        self.update_volume_controls(volume_config.is_muted)
 
         loudnorm = volume_config.loudnorm
         self.loudnorm_group_box.setChecked(loudnorm.enabled)
@@ -441,103 +491,58 @@ class VolumeDialog(QDialog):
         self.dual_mono_check_box.setChecked(loudnorm.dual_mono)
         
         # Set shortcuts, only set when there are values in the configuration
-        if volume_config.volume_up_shortcut and volume_config.volume_up_shortcut.strip():
-            self.volume_up_shortcut_edit.setKeySequence(QKeySequence(volume_config.volume_up_shortcut))
-        else:
-            self.volume_up_shortcut_edit.clear()
-        
-        if volume_config.volume_down_shortcut and volume_config.volume_down_shortcut.strip():
-            self.volume_down_shortcut_edit.setKeySequence(QKeySequence(volume_config.volume_down_shortcut))
-        else:
-            self.volume_down_shortcut_edit.clear()
-
-        if volume_config.mute_shortcut and volume_config.mute_shortcut.strip():
-            self.mute_shortcut_edit.setKeySequence(QKeySequence(volume_config.mute_shortcut))
-        else:
-            self.mute_shortcut_edit.clear()
-        
-        if volume_config.settings_shortcut and volume_config.settings_shortcut.strip():
-            self.settings_shortcut_edit.setKeySequence(QKeySequence(volume_config.settings_shortcut))
-        else:
-            self.settings_shortcut_edit.clear()
+        for attr, (_label, field) in self._EDITOR_FIELDS.items():
+            shortcut = getattr(volume_config, field)
+            editor = self.shortcut_editors[attr]
+            if shortcut and shortcut.strip():
+                editor.setKeySequence(_kseq(shortcut))
+            else:
+                editor.clear()
 
         # Set speed controls
         speed = volume_config.playback_speed
-        self.speed_slider.setValue(int(speed * 100))
+        self.speed_slider.setValue(config.speed_to_percent(speed))
         self.speed_spin_box.setValue(speed)
-        
-        # Set speed shortcuts
-        if volume_config.speed_up_shortcut and volume_config.speed_up_shortcut.strip():
-            self.speed_up_shortcut_edit.setKeySequence(QKeySequence(volume_config.speed_up_shortcut))
-        else:
-            self.speed_up_shortcut_edit.clear()
-            
-        if volume_config.speed_down_shortcut and volume_config.speed_down_shortcut.strip():
-            self.speed_down_shortcut_edit.setKeySequence(QKeySequence(volume_config.speed_down_shortcut))
-        else:
-            self.speed_down_shortcut_edit.clear()
-
-        super().show()
 
     def accept(self) -> None:
         """Validate and save all settings"""
         # Check all shortcuts for validity
-        for editor in self.shortcut_editors.values():
-            sequence = editor.keySequence()
-            if not sequence.isEmpty():
-                key_combination = sequence[0]
-                modifiers = key_combination.keyboardModifiers()
-                has_modifier = bool(modifiers & (
-                    Qt.KeyboardModifier.ControlModifier | 
-                    Qt.KeyboardModifier.AltModifier | 
-                    Qt.KeyboardModifier.ShiftModifier | 
-                    Qt.KeyboardModifier.MetaModifier
-                ))
-                if not has_modifier:
-                    tooltip("Invalid shortcut settings. Please ensure all shortcuts include modifier keys")
-                    return
-        
+        if self._first_invalid_shortcut():
+            tooltip("Invalid shortcut settings. Please ensure all shortcuts include modifier keys")
+            return
+
         # Check for duplicate shortcuts
-        used_shortcuts = {}
-        for name, editor in self.shortcut_editors.items():
-            sequence = editor.keySequence()
-            if not sequence.isEmpty():
-                key_string = sequence.toString()
-                if key_string in used_shortcuts:
-                    tooltip(f"Shortcut '{key_string}' is used multiple times")
-                    return
-                used_shortcuts[key_string] = name
+        duplicate = self._first_duplicate_shortcut()
+        if duplicate:
+            tooltip(f"Shortcut '{duplicate}' is used multiple times")
+            return
 
         # If validation passes, save settings
-        volume_config = config.load_config()
-        
-        # Save volume settings
-        volume_config.volume = self.volume_slider.value()
-        volume_config.is_muted = self.mute_check_box.isChecked()
-        volume_config.allow_volume_boost = self.volume_boost_check_box.isChecked()
-        
-        # Save playback speed (convert from percentage to float)
-        volume_config.playback_speed = self.speed_slider.value() / 100.0
-        
-        # Save shortcut settings
-        volume_config.volume_up_shortcut = self.volume_up_shortcut_edit.keySequence().toString() or ""
-        volume_config.volume_down_shortcut = self.volume_down_shortcut_edit.keySequence().toString() or ""
-        volume_config.mute_shortcut = self.mute_shortcut_edit.keySequence().toString() or ""
-        volume_config.settings_shortcut = self.settings_shortcut_edit.keySequence().toString() or ""
-        volume_config.speed_up_shortcut = self.speed_up_shortcut_edit.keySequence().toString() or ""
-        volume_config.speed_down_shortcut = self.speed_down_shortcut_edit.keySequence().toString() or ""
-        
-        # Save audio normalization settings
-        volume_config.loudnorm.enabled = self.loudnorm_group_box.isChecked()
-        volume_config.loudnorm.i = self.i_spin_box.value()
-        volume_config.loudnorm.dual_mono = self.dual_mono_check_box.isChecked()
+        volume_config = config.VolumeConfig(
+            # Save volume settings
+            volume=self.volume_slider.value(),
+            is_muted=self.mute_check_box.isChecked(),
+            allow_volume_boost=self.volume_boost_check_box.isChecked(),
+
+            # Save playback speed (convert from percentage to float)
+            playback_speed=self.speed_slider.value() / 100.0,
+
+            # Save shortcut settings
+            **{field: self.shortcut_editors[attr].keySequence().toString() or ""
+               for attr, (_label, field) in self._EDITOR_FIELDS.items()},
+
+            # Save audio normalization settings
+            loudnorm=config.LoudnormConfig(
+                enabled=self.loudnorm_group_box.isChecked(),
+                i=self.i_spin_box.value(),
+                dual_mono=self.dual_mono_check_box.isChecked()
+            )
+        )
         
         # Save configuration and update shortcuts
         save_config(volume_config)
-        setup_shortcuts()
         
         # Process events to ensure immediate shortcut update
-        from aqt.qt import QApplication
         QApplication.instance().processEvents()
         
         super().accept()
@@ -618,8 +623,7 @@ class VolumeDialog(QDialog):
         
         # If boost is disabled and current volume > 100%, limit it to 100%
         if not allow_boost and current_volume > 100:
-            self.volume_slider.setValue(100)
-            self.volume_spin_box.setValue(100)
+            _set_value(100, self.volume_slider, self.volume_spin_box)
 
     def validate_shortcut(self):
         """Handle shortcut validation"""
@@ -628,58 +632,65 @@ class VolumeDialog(QDialog):
             return
             
         sequence = editor.keySequence()
+        # Forget the previous sequence of this editor
+        previous = self._seq_by_editor.pop(editor, None)
+        if previous is not None and self._editor_by_seq.get(previous) is editor:
+            del self._editor_by_seq[previous]
         if sequence.isEmpty():
             return
         
-        # Get the first key combination
-        key_combination = sequence[0]
-        
         # Check for modifier keys
-        modifiers = key_combination.keyboardModifiers()
-        has_modifier = bool(modifiers & (
-            Qt.KeyboardModifier.ControlModifier | 
-            Qt.KeyboardModifier.AltModifier | 
-            Qt.KeyboardModifier.ShiftModifier | 
-            Qt.KeyboardModifier.MetaModifier
-        ))
-        
-        if not has_modifier:
+        if not _has_modifier(sequence):
             editor.clear()
             tooltip("Shortcut must include at least one modifier key (Ctrl, Alt, Shift)")
             return
         
         # Check for duplicate shortcuts
         key_string = sequence.toString()
-        current_shortcuts = {}
-        for name, other_editor in self.shortcut_editors.items():
-            if other_editor == editor:
-                continue
-            seq = other_editor.keySequence()
-            if not seq.isEmpty():
-                current_shortcuts[seq.toString()] = name
-        
-        if key_string in current_shortcuts:
+        if key_string in self._editor_by_seq:
             editor.clear()
             tooltip(f"Shortcut '{key_string}' is already used")
             return
 
+        self._seq_by_editor[editor] = key_string
+        self._editor_by_seq[key_string] = editor
+
+    def _first_invalid_shortcut(self) -> Optional[str]:
+        """Return the name of the first shortcut editor lacking a modifier key"""
+        for name, editor in self.shortcut_editors.items():
+            sequence = editor.keySequence()
+            if not sequence.isEmpty() and not _has_modifier(sequence):
+                return name
+        return None
+
+    def _first_duplicate_shortcut(self) -> Optional[str]:
+        """Return the first shortcut assigned to more than one editor"""
+        used_shortcuts = set()
+        for editor in self.shortcut_editors.values():
+            sequence = editor.keySequence()
+            if sequence.isEmpty():
+                continue
+            key_string = sequence.toString()
+            if key_string in used_shortcuts:
+                return key_string
+            used_shortcuts.add(key_string)
+        return None
+
     def _on_speed_slider_changed(self, value: int):
         """Handle slider value changes"""
-        speed = value / 100
-        rounded_speed = _round_to_nearest_step(speed)
-        if self.speed_spin_box.value() != rounded_speed:
-            self.speed_spin_box.setValue(rounded_speed)
-            
+        self._set_speed(value / 100)
+
     def _on_speed_spin_changed(self, value: float):
         """Handle spin box value changes"""
-        rounded_speed = _round_to_nearest_step(value)
-        if value != rounded_speed:
+        self._set_speed(value)
+
+    def _set_speed(self, speed: float) -> None:
+        """Show the rounded speed in both widgets and apply it"""
+        rounded_speed = _round_to_nearest_step(speed)
+        with QSignalBlocker(self.speed_slider), QSignalBlocker(self.speed_spin_box):
+            self.speed_slider.setValue(config.speed_to_percent(rounded_speed))
             self.speed_spin_box.setValue(rounded_speed)
-        
-        slider_value = int(rounded_speed * 100)
-        if self.speed_slider.value() != slider_value:
-            self.speed_slider.setValue(slider_value)
-            
+
         # Update playback speed
         mw.pm.profile['playback_speed'] = rounded_speed
         if hasattr(mw, '_player'):
@@ -688,59 +699,49 @@ class VolumeDialog(QDialog):
 
 def toggle_mute():
     """Toggle mute state only if volume is not 0"""
-    volume_config = config.load_config()
+    volume_config = config.get_config()
     
     # Only toggle mute if volume is greater than 0
     if volume_config.volume > 0:
-        volume_config.is_muted = not volume_config.is_muted
+        volume_config = replace(volume_config, is_muted=not volume_config.is_muted)
         save_config(volume_config)
         tooltip("Sound " + ("Muted" if volume_config.is_muted else "Unmuted"))
     else:
         tooltip("Cannot toggle mute when volume is 0")
 
+def _open_dialog():
+    """Open the settings dialog"""
+    VolumeDialog(mw).show()
+
+
+# Config field of each global shortcut and the function it triggers
+_HANDLERS = (
+    ('volume_up_shortcut', functools.partial(adjust_volume, 10)),
+    ('volume_down_shortcut', functools.partial(adjust_volume, -10)),
+    ('mute_shortcut', toggle_mute),
+    ('settings_shortcut', _open_dialog),
+    ('speed_up_shortcut', functools.partial(adjust_speed, 0.1)),
+    ('speed_down_shortcut', functools.partial(adjust_speed, -0.1))
+)
+
+
 def setup_shortcuts():
     """Setup global shortcuts for volume control"""
-    volume_config = config.load_config()
-    
-    # Initialize shortcuts list if not exists
+    global _last_shortcut_sig
+    volume_config = config.get_config()
+    _last_shortcut_sig = _shortcut_sig(volume_config)
+
+    # Create the shortcuts once, later calls only update their keys
     if not hasattr(mw, '_volume_shortcuts'):
-        mw._volume_shortcuts = []
-    
-    def register_shortcut(key, fn):
-        if not key or key.isspace():  # Skip if shortcut is empty or whitespace
-            return None
-        action = QAction(mw)
-        action.setShortcut(QKeySequence(key))
-        # Use ApplicationShortcut to work across all Anki windows
-        action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
-        action.triggered.connect(fn)
-        # Add action to the main window to ensure it's always available
-        mw.addAction(action)
-        return action
-    
-    # Register new shortcuts
-    shortcuts = [
-        (volume_config.volume_up_shortcut, lambda: adjust_volume(10)),
-        (volume_config.volume_down_shortcut, lambda: adjust_volume(-10)),
-        (volume_config.mute_shortcut, toggle_mute),
-        (volume_config.settings_shortcut, lambda: VolumeDialog(mw).show()),
-        (volume_config.speed_up_shortcut, lambda: adjust_speed(0.1)),
-        (volume_config.speed_down_shortcut, lambda: adjust_speed(-0.1))
-    ]
-    
-    # Clear existing shortcuts
-    if hasattr(mw, '_volume_shortcuts'):
-        for action in mw._volume_shortcuts:
-            action.setShortcut(QKeySequence(""))
-            action.setEnabled(False)
-            mw.removeAction(action)
-            action.deleteLater()
-        mw._volume_shortcuts = []
-    
-    # Register new shortcuts
-    mw._volume_shortcuts = []  # Reset the list
-    for shortcut, callback in shortcuts:
-        if action := register_shortcut(shortcut, callback):
-            mw._volume_shortcuts.append(action)
-            # Ensure the action stays active
-            action.setEnabled(True)
+        mw._volume_shortcuts = {}
+        for name, callback in _HANDLERS:
+            shortcut = QShortcut(mw)
+            # Use ApplicationShortcut to work across all Anki windows
+            shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+            shortcut.activated.connect(callback)
+            mw._volume_shortcuts[name] = shortcut
+
+    for name, shortcut in mw._volume_shortcuts.items():
+        key = getattr(volume_config, name)
+        # An empty key sequence disables the shortcut
+        shortcut.setKey(_kseq(key if key and not key.isspace() else ""))